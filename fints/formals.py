@@ -283,10 +283,12 @@ class TaskHashAlgorithm(RepresentableEnum):
 
 
 class TwoStepParametersCommon(DataElementGroup):
-    @property
-    def VERSION(self):
-        """TAN mechanism version"""
-        return int(re.match(r'^(\D+)(\d+)$', self.__class__.__name__).group(2))
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # TAN mechanism version, taken from the class name once instead of on every access
+        match = re.match(r'^\D+(\d+)$', cls.__name__)
+        if match:
+            cls.VERSION = int(match.group(1))
 
     security_function = DataElementField(type='code', max_length=3, _d="Sicherheitsfunktion kodiert")
     tan_process = DataElementField(type='code', length=1, _d="TAN-Prozess")
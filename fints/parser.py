@@ -60,6 +60,8 @@ TOKEN_RE = re.compile(rb"""
                             | (?: @ (?P<BINLEN>[0-9]+) @ )
                          )""", re.X | re.S)
 
+ESCAPE_RE = re.compile(r"([+:'@?])")
+
 
 class Token(Enum):
     EOF = 'eof'
@@ -147,11 +149,8 @@ class FinTS3Parser:
         if isinstance(data, bytes):
             data = self.explode_segments(data)
 
-        message = SegmentSequence()
-        for segment in data:
-            seg = self.parse_segment(segment)
-            message.segments.append(seg)
-        return message
+        parse_segment = self.parse_segment
+        return SegmentSequence([parse_segment(segment) for segment in data])
 
     def parse_segment(self, segment):
         clazz = FinTS3Segment.find_subclass(segment)
@@ -166,10 +165,10 @@ class FinTS3Parser:
                 raise
 
     def _parse_segment_as_class(self, clazz, segment):
-        seg = clazz()
+        seg = clazz._new_without_header()
 
         data = iter(segment)
-        for name, field in seg._fields.items():
+        for name, field in seg._fields_tuple:
             repeat = field.count != 1
             constructed = isinstance(field, DataElementGroupField)
             
@@ -234,7 +233,7 @@ class FinTS3Parser:
     def parse_deg(self, clazz, data_i, required=True):
         retval = clazz()
 
-        for number, (name, field) in enumerate(retval._fields.items()):
+        for number, (name, field) in enumerate(retval._fields_tuple):
             repeat = field.count != 1
             constructed = isinstance(field, DataElementGroupField)
             is_last = number == len(retval._fields)-1
@@ -329,19 +328,15 @@ class FinTS3Serializer:
         if isinstance(message, (list, tuple, Iterable)):
             message = SegmentSequence(list(message))
 
-        result = []
-
-        for segment in message.segments:
-            result.append(self.serialize_segment(segment))
-
-        return self.implode_segments(result)
+        serialize_segment = self.serialize_segment
+        return self.implode_segments([serialize_segment(segment) for segment in message.segments])
 
     def serialize_segment(self, segment):
 
         seg = []
         filler = []
 
-        for name, field in segment._fields.items():
+        for name, field in segment._fields_tuple:
             repeat = field.count != 1
             constructed = isinstance(field, DataElementGroupField)
 
@@ -386,7 +381,7 @@ class FinTS3Serializer:
         result = []
         filler = []
 
-        for name,field in deg._fields.items():
+        for name,field in deg._fields_tuple:
             repeat = field.count != 1
             constructed = isinstance(field, DataElementGroupField)
 
@@ -448,7 +443,7 @@ class FinTS3Serializer:
     @staticmethod
     def escape_value(val):
         if isinstance(val, str):
-            return re.sub(r"([+:'@?])", r"?\1", val).encode('iso-8859-1')
+            return ESCAPE_RE.sub(r"?\1", val).encode('iso-8859-1')
         elif isinstance(val, bytes):
             return "@{}@".format(len(val)).encode('us-ascii') + val
         elif val is None:
@@ -1,64 +1,86 @@
-import re
+import sys
 
 from fints.fields import DataElementField, DataElementGroupField, IntCodeField
 from fints.formals import SecurityClass, SegmentHeader
 from fints.types import Container, ContainerMeta
-from fints.utils import SubclassesMixin, classproperty
+from fints.utils import SubclassesMixin
 
-TYPE_VERSION_RE = re.compile(r'^([A-Z]+)(\d+)$')
+# DataElementGroup types that have already passed _check_fields_recursive
+_VALIDATED_GROUPS = set()
+
+
+def _split_type_version(name):
+    """Split a segment class name like ``HNHBK3`` into ``('HNHBK', 3)``.
+
+    Returns None if the name does not consist of upper-case ASCII letters followed by digits."""
+    for i, ch in enumerate(name):
+        if ch.isdigit():
+            type_, version = name[:i], name[i:]
+            if type_.isascii() and type_.isalpha() and type_.isupper() and version.isascii() and version.isdigit():
+                return type_, int(version)
+            return None
+    return None
 
 
 class FinTS3SegmentMeta(ContainerMeta):
     @staticmethod
     def _check_fields_recursive(instance):
-        for name, field in instance._fields.items():
+        for name, field in instance._fields_tuple:
             if not isinstance(field, (DataElementField, DataElementGroupField)):
                 raise TypeError("{}={!r} is not DataElementField or DataElementGroupField".format(name, field))
-            if isinstance(field, DataElementGroupField):
+            if isinstance(field, DataElementGroupField) and field.type not in _VALIDATED_GROUPS:
                 FinTS3SegmentMeta._check_fields_recursive(field.type)
+                _VALIDATED_GROUPS.add(field.type)
 
     def __new__(cls, name, bases, classdict):
         retval = super().__new__(cls, name, bases, classdict)
         FinTS3SegmentMeta._check_fields_recursive(retval)
+
+        type_version = _split_type_version(name)
+        if type_version:
+            retval.TYPE = sys.intern(type_version[0])
+            retval.VERSION = type_version[1]
+            retval._type_version_index[(retval.TYPE, retval.VERSION)] = retval
+        else:
+            retval.TYPE = retval.VERSION = None
+
         return retval
 
 
 class FinTS3Segment(Container, SubclassesMixin, metaclass=FinTS3SegmentMeta):
     header = DataElementGroupField(type=SegmentHeader, _d="Segmentkopf")
 
-    @classproperty
-    def TYPE(cls):
-        match = TYPE_VERSION_RE.match(cls.__name__)
-        if match:
-            return match.group(1)
-
-    @classproperty
-    def VERSION(cls):
-        match = TYPE_VERSION_RE.match(cls.__name__)
-        if match:
-            return int(match.group(2))
+    _type_version_index = {}
 
     def __init__(self, *args, **kwargs):
-        if 'header' not in kwargs:
-            kwargs['header'] = SegmentHeader(self.TYPE, None, self.VERSION)
+        if 'header' in kwargs:
+            header = kwargs.pop('header')
+        else:
+            header = SegmentHeader(self.TYPE, None, self.VERSION)
 
-        args = (kwargs.pop('header'), ) + args
+        super().__init__(header, *args, **kwargs)
 
-        super().__init__(*args, **kwargs)
+    @classmethod
+    def _new_without_header(cls):
+        """Create an empty segment without synthesizing a default header.
+
+        Used by the parser, which sets the header from the received data right afterwards."""
+        retval = cls.__new__(cls)
+        Container.__init__(retval)
+        return retval
 
     @classmethod
     def find_subclass(cls, segment):
-        h = SegmentHeader.naive_parse(segment[0])
-        target_cls = None
-
-        for possible_cls in cls._all_subclasses():
-            if getattr(possible_cls, 'TYPE', None) == h.type and getattr(possible_cls, 'VERSION', None) == h.version:
-                target_cls = possible_cls
+        # Only type and version are needed for dispatch, the header itself is parsed along with the segment
+        try:
+            target_cls = cls._type_version_index.get((segment[0][0], int(segment[0][2], 10)))
+        except (IndexError, TypeError, ValueError):
+            return cls
 
-        if not target_cls:
-            target_cls = cls
+        if target_cls is not None and issubclass(target_cls, cls):
+            return target_cls
 
-        return target_cls
+        return cls
 
 
 class ParameterSegment_22(FinTS3Segment):
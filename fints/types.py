@@ -90,19 +90,35 @@ class Field:
 
 
 class TypedField(Field, SubclassesMixin):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A new subclass may change which class a type resolves to for any of its ancestors
+        for supercls in cls.__mro__[1:]:
+            if '_target_cls_cache' in vars(supercls):
+                delattr(supercls, '_target_cls_cache')
+
     def __new__(cls, *args, **kwargs):
+        type_ = kwargs.get('type', None)
+        cache = vars(cls).get('_target_cls_cache')
+        if cache is None:
+            cache = cls._target_cls_cache = {}
+        if type_ not in cache:
+            cache[type_] = cls._find_target_cls(type_)
+        return object.__new__(cache[type_])
+
+    @classmethod
+    def _find_target_cls(cls, type_):
         target_cls = None
         fallback_cls = None
         for subcls in cls._all_subclasses():
             if getattr(subcls, 'type', '') is None:
                 fallback_cls = subcls
-            if getattr(subcls, 'type', None) == kwargs.get('type', None):
+            if getattr(subcls, 'type', None) == type_:
                 target_cls = subcls
                 break
         if target_cls is None and fallback_cls is not None and issubclass(fallback_cls, cls):
             target_cls = fallback_cls
-        retval = object.__new__(target_cls or cls)
-        return retval
+        return target_cls or cls
 
     def __init__(self, type=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -275,14 +291,15 @@ class SegmentSequence:
             callback = lambda s: True
 
         for s in self.segments:
-            if ((not query) or any((isinstance(s, t) if isinstance(t, type) else s.header.type == t) for t in query)) and \
-                    ((not version) or any(s.header.version == v for v in version)) and \
+            header = s.header
+            if ((not query) or any((isinstance(s, t) if isinstance(t, type) else header.type == t) for t in query)) and \
+                    ((not version) or any(header.version == v for v in version)) and \
                     callback(s):
                 yield s
                 found_something = True
 
             if recurse:
-                for name, field in s._fields.items():
+                for name, field in s._fields_tuple:
                     val = getattr(s, name)
                     if val and hasattr(val, 'find_segments'):
                         for v in val.find_segments(query=query, version=version, callback=callback, recurse=recurse):
@@ -328,16 +345,21 @@ class ContainerMeta(type):
         return OrderedDict()
 
     def __new__(cls, name, bases, classdict):
+        # Field values live in _values, so instances need no __dict__ of their own
+        classdict.setdefault('__slots__', ())
         retval = super().__new__(cls, name, bases, classdict)
         retval._fields = OrderedDict()
         for supercls in reversed(bases):
             if hasattr(supercls, '_fields'):
-                retval._fields.update((k, v) for (k, v) in supercls._fields.items())
+                retval._fields.update(supercls._fields)
         retval._fields.update((k, v) for (k, v) in classdict.items() if isinstance(v, Field))
+        retval._fields_tuple = tuple(retval._fields.items())
         return retval
 
 
 class Container(metaclass=ContainerMeta):
+    __slots__ = ('_values', '_additional_data')
+
     def __init__(self, *args, **kwargs):
         init_values = OrderedDict()
 
@@ -360,12 +382,19 @@ class Container(metaclass=ContainerMeta):
         for k, v in init_values.items():
             setattr(self, k, v)
 
+    def __setstate__(self, state):
+        # Slotted instances pickle as (None, slots), pickles from before __slots__ as a plain dict
+        if isinstance(state, tuple):
+            state = state[1]
+        for k, v in state.items():
+            setattr(self, k, v)
+
     @classmethod
     def naive_parse(cls, data):
         if data is None:
             raise TypeError("No data provided")
         retval = cls()
-        for ((name, field), value) in zip(retval._fields.items(), data):
+        for ((name, field), value) in zip(retval._fields_tuple, data):
             setattr(retval, name, value)
         return retval
 
@@ -381,7 +410,7 @@ class Container(metaclass=ContainerMeta):
 
     @property
     def _repr_items(self):
-        for name, field in self._fields.items():
+        for name, field in self._fields_tuple:
             val = getattr(self, name)
             if not field.required:
                 if isinstance(val, Container):
@@ -74,11 +74,24 @@ def decompress_datablob(magic: bytes, blob: bytes, obj: object = None):
 
 
 class SubclassesMixin:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A new subclass invalidates the cached subclass lists of all its ancestors
+        for supercls in cls.__mro__[1:]:
+            if '_all_subclasses_cache' in vars(supercls):
+                delattr(supercls, '_all_subclasses_cache')
+
     @classmethod
     def _all_subclasses(cls):
-        for subcls in cls.__subclasses__():
-            yield from subcls._all_subclasses()
-        yield cls
+        retval = vars(cls).get('_all_subclasses_cache')
+        if retval is None:
+            retval = tuple(
+                clazz for subcls in cls.__subclasses__() for clazz in subcls._all_subclasses()
+            ) + (cls, )
+            cls._all_subclasses_cache = retval
+        return retval
 
 
 class DocTypeMixin:
@@ -125,6 +138,8 @@ class FixedLengthMixin:
 
 
 class ShortReprMixin:
+    __slots__ = ()
+
     def __repr__(self):
         return "{}{}({})".format(
             "{}.".format(self.__class__.__module__),
@@ -48,6 +48,20 @@ def test_segment_subclassing():
     assert list(ISUBTST1._fields.keys()) == ['header', 'a', 'b', 'c']
 
 
+def test_all_subclasses_cache_invalidated():
+    class Base1(FinTS3Segment):
+        pass
+
+    assert Base1._all_subclasses() == (Base1, )
+    assert Base1 in FinTS3Segment._all_subclasses()
+
+    class ISUBTST2(Base1):
+        pass
+
+    assert Base1._all_subclasses() == (ISUBTST2, Base1)
+    assert ISUBTST2 in FinTS3Segment._all_subclasses()
+
+
 def test_descriptor_subclassing():
     a = DataElementField(type='an')
     assert isinstance(a, AlphanumericField)
@@ -130,6 +144,22 @@ def test_find_subclass():
     assert clazz is HNHBS1
 
 
+def test_find_subclass_unknown():
+    a = [
+        ['HNHBS', '2', '99', ],
+        '3'
+    ]
+
+    clazz = FinTS3Segment.find_subclass(a)
+    assert clazz is FinTS3Segment
+
+
+def test_find_subclass_malformed_header():
+    assert FinTS3Segment.find_subclass([['HNHBS', '2'], '3']) is FinTS3Segment
+    assert FinTS3Segment.find_subclass([['HNHBS', '2', 'x'], '3']) is FinTS3Segment
+    assert FinTS3Segment.find_subclass(['HNHBS', '3']) is FinTS3Segment
+
+
 def test_nested_output_evalable():
     import fints.segments, fints.formals
 
@@ -224,3 +254,11 @@ def test_nested_output_evalable():
 
     for s1, s2 in zip(a.segments, b.segments):
         assert type(s1) == type(s2)
+
+
+def test_segment_has_no_instance_dict():
+    a = HNHBS1(message_number=3)
+
+    assert not hasattr(a, '__dict__')
+    with pytest.raises(AttributeError):
+        a.foo = 1